@@ -10,27 +10,31 @@ Options:
   -h --help           Show this screen.
   -r --repeats=<rp>   Number of repeats. Minimum 4. [default: 16]
   -t --min-time=<mt>  Shortest time that a run must take [default: 1]
+  --max-time=<mt>     Longest time a run may be projected to take before its
+                      function is dropped. Defaults to 10 times --min-time.
   --test-N=<N>         The size of input to use for the test section [default: 100000]
+  --persist           Keep datasets in the temporary directory between runs.
 """
 
 import docopt
+import gc
 import least_squares_regression
 import least_squares_regression_bytecode
-import numpy
+import least_squares_regression_datasets
+import least_squares_regression_numba
+import sys
 import terminal_bars
 
-from blessings import Terminal
-from decimal import Decimal
-from functools import partial
-from math import isnan, floor, log10
-from statistics import stdev, StatisticsError
-from timeit import Timer
+from math import inf, isfinite, isnan, sqrt
+from time import perf_counter_ns
 
 
 options = docopt.docopt(__doc__)
 N = int(options["--test-N"])
 REPEATS = int(options["--repeats"])
 MINTIME = float(options["--min-time"])
+MAXTIME = float(options["--max-time"] or MINTIME * 10)
+PERSIST = options["--persist"]
 
 si_prefixes = [
     "y", "z", "a", "f", "p", "n", "µ", "m", "",
@@ -38,10 +42,16 @@ si_prefixes = [
 ]
 
 def engineering(number):
-    number = Decimal("{:.3e}".format(number))
-    exponents = floor(log10(number) / 3)
+    if number == 0 or not isfinite(number):
+        return "{:.3f}".format(number), ""
 
-    return number.scaleb(-3*exponents), si_prefixes[exponents+8]
+    # Shift the decimal point of the 4 significant figures
+    # to the nearest lower multiple of 3 in the exponent
+    mantissa, exponent = "{:.3e}".format(number).split("e")
+    sign, digits = mantissa[:-5], mantissa[-5] + mantissa[-3:]
+    exponents, point = divmod(int(exponent), 3)
+
+    return sign + digits[:point+1] + "." + digits[point+1:], si_prefixes[exponents+8]
 
 def format_constant_space(number, unit):
     if isnan(number):
@@ -50,23 +60,24 @@ def format_constant_space(number, unit):
     scaled, prefix = engineering(number)
     return "{} {:<2}".format(scaled, prefix+unit)
 
-def format_results(n, repeats, times, completed=1):
+def format_results(n, repeats, count, tmin, tsum, tsumsq, completed=1):
     template = (
         "{n:10} items, {repeats} loops:  "
         "{mintime} (± {error})  per item  "
         "({total} total) [{percent:4.0%}]"
     )
 
-    mintime = min(times) / (repeats*n)
+    mintime = tmin / (repeats*n)
 
-    try:
+    if count > 1:
         # True time is in theory below the lowest time,
         # so all deviation is above it
-        error = stdev(times, xbar=mintime) / (repeats*n)
-    except StatisticsError:
+        variance = (tsumsq - 2*tmin*tsum + count*tmin*tmin) / (count-1)
+        error = sqrt(max(variance, 0)) / (repeats*n)
+    else:
         error = float("nan")
 
-    total = sum(times)
+    total = tsum
 
     return template.format(
         n=n, repeats=repeats,
@@ -76,6 +87,19 @@ def format_results(n, repeats, times, completed=1):
         percent = completed
     )
 
+def bench(function, x, y, number, perf_counter_ns=perf_counter_ns):
+    # Like timeit, keep the collector from firing mid-measurement
+    gcold = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter_ns()
+        for _ in range(number):
+            function(x, y)
+        return (perf_counter_ns() - start) * 1e-9
+    finally:
+        if gcold:
+            gc.enable()
+
 def orders_n(start=100, factor=2):
     x = start
     while True:
@@ -87,25 +111,28 @@ functions = (
     least_squares_regression_bytecode.bytecode_auto_numpy_lstsqr,
     least_squares_regression_bytecode.bytecode_auto2_numpy_lstsqr,
     least_squares_regression_bytecode.bytecode_auto_scipy_lstsqr,
+    least_squares_regression_bytecode.bytecode_scipy_gelsy_lstsqr,
+    least_squares_regression_bytecode.bytecode_scipy_gelsd_lstsqr,
+    least_squares_regression_bytecode.bytecode_cholesky_lstsqr,
     least_squares_regression_bytecode.bytecode_untyped_lstsqr,
     least_squares_regression.matrix_lstsqr,
     least_squares_regression.auto_numpy_lstsqr,
     least_squares_regression.auto2_numpy_lstsqr,
     least_squares_regression.auto_scipy_lstsqr,
+    least_squares_regression.scipy_gelsy_lstsqr,
+    least_squares_regression.scipy_gelsd_lstsqr,
+    least_squares_regression.cholesky_lstsqr,
     least_squares_regression.untyped_lstsqr,
     least_squares_regression.simply_typed_lstsqr,
     least_squares_regression.memoryview_lstsqr,
     least_squares_regression.fully_typed_lstsqr,
     least_squares_regression.parallel_lstsqr,
+    least_squares_regression_numba.numba_lstsqr,
+    least_squares_regression_numba.parallel_numba_lstsqr,
+    least_squares_regression_numba.unrolled_numba_lstsqr,
 )
 
 function_times = dict.fromkeys(functions, float("inf"))
-datasets = {}
-
-numpy.random.seed(12345)
-x = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-y = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-datasets[N] = x, y
 
 print("TEST:")
 print()
@@ -113,7 +140,7 @@ print()
 namespace = max(len(function.__name__) for function in functions) + 1
 
 for function in functions:
-    slope, intercept = function(*datasets[N])
+    slope, intercept = function(*least_squares_regression_datasets.get_dataset(N, persist=PERSIST))
     print("{:<{}} y = {:.10f}·x + {:.10f}".format(function.__name__+":", namespace, slope, intercept))
 
 print()
@@ -123,12 +150,7 @@ print()
 
 
 
-def print_summary():
-    print()
-    print()
-    print("SUMMARY:")
-    print()
-
+def format_summary():
     def simpleformatter(num):
         if num < 10:
             return str(round(num, 1))
@@ -145,84 +167,66 @@ def print_summary():
     names = [function.__name__ for function, _ in finaltimes]
     times = [time / besttime   for _, time     in finaltimes]
 
-    terminal_bars.plot(names, times, 200, formatter=simpleformatter)
-
-    print()
-    print("Zoomed:")
-    print()
-
-    terminal_bars.plot(names, times, 200, formatter=simpleformatter, maximum=times[0]*20)
+    return "\n".join([
+        "",
+        "",
+        "SUMMARY:",
+        "",
+        terminal_bars.plot(names, times, 200, formatter=simpleformatter),
+        "",
+        "Zoomed:",
+        "",
+        terminal_bars.plot(names, times, 200, formatter=simpleformatter, maximum=times[0]*20),
+        "",
+    ])
 
 
-terminal = Terminal()
 space_needed = len(functions)*2 + 12
 
-import itertools
-from heapq import heappush, heappop
-
-pq = []                         # list of entries arranged in a heap
-entry_finder = {}               # mapping of tasks to entries
-REMOVED = object()              # placeholder for a removed task
-counter = itertools.count()     # unique sequence count
-
-def add_task(task, priority=0):
-    'Add a new task or update the priority of an existing task'
-    if task in entry_finder:
-        remove_task(task)
-    count = next(counter)
-    entry = [priority, count, task]
-    entry_finder[task] = entry
-    heappush(pq, entry)
-
-def remove_task(task):
-    'Mark an existing task as REMOVED.  Raise KeyError if not found.'
-    entry = entry_finder.pop(task)
-    entry[-1] = REMOVED
-
-def pop_task():
-    'Remove and return the lowest priority task. Raise KeyError if empty.'
-    while pq:
-        priority, count, task = heappop(pq)
-        if task is not REMOVED:
-            del entry_finder[task]
-            return task
-    raise KeyError('pop from an empty priority queue')
+# (priority, function, sizes) for every function still being timed;
+# there are few enough that a linear scan for the minimum is cheapest
+tasks = [(0, function, orders_n()) for function in functions]
 
-for function in functions:
-    add_task((function, orders_n()), 0)
 
+sys.stdout.write("\n" * space_needed)
 
-for _ in range(space_needed):
-    print()
+# Cursor up over the last frame and clear it; as with blessings'
+# move_up, nothing is emitted when output is not a terminal
+redraw = "\x1b[{}A\x1b[J".format(space_needed) if sys.stdout.isatty() else ""
 
-while pq:
-    function, ngenerator = pop_task()
+while tasks:
+    _, function, ngenerator = tasks.pop(min(range(len(tasks)), key=lambda i: tasks[i][0]))
     N = next(ngenerator)
 
-    if N not in datasets:
-        numpy.random.seed(12345)
-        x = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-        y = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-        datasets[N] = x, y
-
     numtimes = int(REPEATS ** 0.5)
-    times = []
-    functimer = Timer(partial(function, *datasets[N]))
 
-    for i in range(numtimes):
-        times.append(functimer.timeit(REPEATS))
+    # Runaway guard: drop a function rather than start a run that its last
+    # time per item projects past MAXTIME. Each run follows one under
+    # MINTIME at half the size, so this only trips when --max-time is set
+    # below about twice --min-time
+    per_item = function_times[function]
+    if isfinite(per_item) and per_item * N * REPEATS * numtimes > MAXTIME:
+        continue
 
-    for _ in range(space_needed):
-        print(terminal.move_up(), end="")
+    tmin, tsum = inf, 0.0
+    x, y = least_squares_regression_datasets.get_dataset(N, persist=PERSIST)
 
-    print("{:>30}   {}   {}".format(
+    for i in range(numtimes):
+        taken = bench(function, x, y, REPEATS)
+        tmin = min(tmin, taken)
+        tsum += taken
+
+    status = "{:>30}   {}   {}".format(
         function.__name__,
         format_constant_space(N, ""),
-        format_constant_space(sum(times), "s")
-    ))
-    print_summary()
+        format_constant_space(tsum, "s")
+    )
+
+    # Replace the last frame in one write
+    sys.stdout.write("{}{}\n{}".format(redraw, status, format_summary()))
+    sys.stdout.flush()
 
-    function_times[function] = min(times) / (REPEATS*N)
+    function_times[function] = tmin / (REPEATS*N)
 
-    if sum(times) < MINTIME:
-        add_task((function, ngenerator), sum(times))
+    if tsum < MINTIME:
+        tasks.append((tsum, function, ngenerator))
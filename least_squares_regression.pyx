@@ -1,4 +1,5 @@
 import numpy as np
+import scipy.linalg
 import scipy.stats
 
 cimport cython
@@ -6,13 +7,21 @@ cimport openmp
 from cython.parallel cimport prange
 
 def matrix_lstsqr(x, y):
-    X = np.vstack([x, np.ones(len(x))]).T
-    return (np.linalg.inv(X.T.dot(X)).dot(X.T)).dot(y)
+    # Normal equations of X = [x, 1] written out as 2x2 terms, so
+    # neither X nor the 2xN pseudo-inverse is ever built
+    n = len(x)
+    x_tot = x.sum()
+    y_tot = y.sum()
+    xx_tot = x.dot(x)
+    xy_tot = x.dot(y)
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
+    return np.array([slope, y_interc])
 
 
 def auto_numpy_lstsqr(x, y):
     X = np.vstack([x, np.ones(len(x))]).T
-    return np.linalg.lstsq(X,y)[0]
+    return np.linalg.lstsq(X, y, rcond=None)[0]
 
 
 def auto2_numpy_lstsqr(x, y):
@@ -23,33 +32,61 @@ def auto_scipy_lstsqr(x,y):
     return scipy.stats.linregress(x, y)[0:2]
 
 
+def scipy_gelsy_lstsqr(x, y):
+    X = np.vstack([x, np.ones(len(x))]).T
+    return scipy.linalg.lstsq(X, y, lapack_driver="gelsy", check_finite=False)[0]
+
+
+def scipy_gelsd_lstsqr(x, y):
+    X = np.vstack([x, np.ones(len(x))]).T
+    return scipy.linalg.lstsq(X, y, lapack_driver="gelsd", check_finite=False)[0]
+
+
+def cholesky_lstsqr(x, y):
+    x_tot = x.sum()
+    A = np.array([[x.dot(x), x_tot], [x_tot, len(x)]])
+    b = np.array([x.dot(y), y.sum()])
+    factor = scipy.linalg.cho_factor(A, check_finite=False)
+    return scipy.linalg.cho_solve(factor, b, check_finite=False)
+
+
 def untyped_lstsqr(x, y):
-    x_avg = sum(x)/len(x)
-    y_avg = sum(y)/len(y)
-    var_x = sum([(x_i - x_avg)**2 for x_i in x])
-    cov_xy = sum([(x_i - x_avg)*(y_i - y_avg) for x_i,y_i in zip(x,y)])
-    slope = cov_xy / var_x
-    y_interc = y_avg - slope*x_avg
+    n = 0
+    x_tot = y_tot = xx_tot = xy_tot = 0.0
+    for x_i, y_i in zip(x, y):
+        x_tot += x_i
+        y_tot += y_i
+        xx_tot += x_i*x_i
+        xy_tot += x_i*y_i
+        n += 1
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
     return (slope, y_interc)
 
 def simply_typed_lstsqr(x, y):
-    cdef double x_avg, y_avg, var_x, cov_xy, slope, y_interc, x_i, y_i
-    x_avg = sum(x)/x.shape[0]
-    y_avg = sum(y)/y.shape[0]
-    var_x = sum([(x_i - x_avg)**2 for x_i in x])
-    cov_xy = sum([(x_i - x_avg)*(y_i - y_avg) for x_i,y_i in zip(x,y)])
-    slope = cov_xy / var_x
-    y_interc = y_avg - slope*x_avg
+    cdef double x_tot=0, y_tot=0, xx_tot=0, xy_tot=0, slope, y_interc, x_i, y_i
+    cdef Py_ssize_t n = 0
+    for x_i, y_i in zip(x, y):
+        x_tot += x_i
+        y_tot += y_i
+        xx_tot += x_i*x_i
+        xy_tot += x_i*y_i
+        n += 1
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
     return (slope, y_interc)
 
 def memoryview_lstsqr(double[:] x, double[:] y):
-    cdef double x_avg, y_avg, var_x, cov_xy, slope, y_interc, x_i, y_i
-    x_avg = sum(x)/x.shape[0]
-    y_avg = sum(y)/y.shape[0]
-    var_x = sum([(x_i - x_avg)**2 for x_i in x])
-    cov_xy = sum([(x_i - x_avg)*(y_i - y_avg) for x_i,y_i in zip(x,y)])
-    slope = cov_xy / var_x
-    y_interc = y_avg - slope*x_avg
+    cdef double x_tot=0, y_tot=0, xx_tot=0, xy_tot=0, slope, y_interc, x_i, y_i
+    cdef Py_ssize_t n = 0
+    for x_i, y_i in zip(x, y):
+        x_tot += x_i
+        y_tot += y_i
+        xx_tot += x_i*x_i
+        xy_tot += x_i*y_i
+        n += 1
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
     return (slope, y_interc)
 
 @cython.boundscheck(False)
@@ -1,14 +1,23 @@
 import numpy as np
+import scipy.linalg
 import scipy.stats
 
 def bytecode_matrix_lstsqr(x, y):
-    X = np.vstack([x, np.ones(len(x))]).T
-    return (np.linalg.inv(X.T.dot(X)).dot(X.T)).dot(y)
+    # Normal equations of X = [x, 1] written out as 2x2 terms, so
+    # neither X nor the 2xN pseudo-inverse is ever built
+    n = len(x)
+    x_tot = x.sum()
+    y_tot = y.sum()
+    xx_tot = x.dot(x)
+    xy_tot = x.dot(y)
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
+    return np.array([slope, y_interc])
 
 
 def bytecode_auto_numpy_lstsqr(x, y):
     X = np.vstack([x, np.ones(len(x))]).T
-    return np.linalg.lstsq(X,y)[0]
+    return np.linalg.lstsq(X, y, rcond=None)[0]
 
 
 def bytecode_auto2_numpy_lstsqr(x, y):
@@ -19,11 +28,33 @@ def bytecode_auto_scipy_lstsqr(x,y):
     return scipy.stats.linregress(x, y)[0:2]
 
 
+def bytecode_scipy_gelsy_lstsqr(x, y):
+    X = np.vstack([x, np.ones(len(x))]).T
+    return scipy.linalg.lstsq(X, y, lapack_driver="gelsy", check_finite=False)[0]
+
+
+def bytecode_scipy_gelsd_lstsqr(x, y):
+    X = np.vstack([x, np.ones(len(x))]).T
+    return scipy.linalg.lstsq(X, y, lapack_driver="gelsd", check_finite=False)[0]
+
+
+def bytecode_cholesky_lstsqr(x, y):
+    x_tot = x.sum()
+    A = np.array([[x.dot(x), x_tot], [x_tot, len(x)]])
+    b = np.array([x.dot(y), y.sum()])
+    factor = scipy.linalg.cho_factor(A, check_finite=False)
+    return scipy.linalg.cho_solve(factor, b, check_finite=False)
+
+
 def bytecode_untyped_lstsqr(x, y):
-    x_avg = sum(x)/len(x)
-    y_avg = sum(y)/len(y)
-    var_x = sum([(x_i - x_avg)**2 for x_i in x])
-    cov_xy = sum([(x_i - x_avg)*(y_i - y_avg) for x_i,y_i in zip(x,y)])
-    slope = cov_xy / var_x
-    y_interc = y_avg - slope*x_avg
+    n = 0
+    x_tot = y_tot = xx_tot = xy_tot = 0.0
+    for x_i, y_i in zip(x, y):
+        x_tot += x_i
+        y_tot += y_i
+        xx_tot += x_i*x_i
+        xy_tot += x_i*y_i
+        n += 1
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
     return (slope, y_interc)
\ No newline at end of file
@@ -0,0 +1,60 @@
+import functools
+import numpy
+import os
+import tempfile
+
+DATASET_CAP = 2**22
+COEFFICIENTS = numpy.array([0.8, 0.9, 1.0, 1.1])
+# Part of every persisted filename; bump whenever _prefix would generate
+# different data, so stale files are regenerated rather than reused
+FORMAT_VERSION = 2
+
+_generated = {}
+
+def _prefix(N, seed):
+    # Every dataset for a seed is a prefix of one shared pair of arrays,
+    # generated once up to DATASET_CAP and only regrown if a larger N is needed.
+    # x and y draw from independent streams, and uint32 draws keep no
+    # per-call buffer, so the values never depend on how growth was chunked
+    if seed not in _generated:
+        x_rng, y_rng = (numpy.random.default_rng(child) for child in numpy.random.SeedSequence(seed).spawn(2))
+        _generated[seed] = x_rng, y_rng, numpy.empty(0), numpy.empty(0)
+
+    x_rng, y_rng, x, y = _generated[seed]
+    start = len(x)
+
+    if N > start:
+        stop = max(N, 2*start, DATASET_CAP)
+        indices = numpy.arange(start, stop, dtype=numpy.float64)
+
+        x_extra = COEFFICIENTS[x_rng.integers(len(COEFFICIENTS), size=stop-start, dtype=numpy.uint32)] * indices
+        y_extra = COEFFICIENTS[y_rng.integers(len(COEFFICIENTS), size=stop-start, dtype=numpy.uint32)] * indices
+
+        x = numpy.concatenate([x, x_extra])
+        y = numpy.concatenate([y, y_extra])
+        _generated[seed] = x_rng, y_rng, x, y
+
+    return x[:N], y[:N]
+
+def get_dataset(N, seed=12345, persist=False):
+    # In memory a dataset is just a slice, so only the loaded maps
+    # are cached; caching slices would pin pre-growth arrays
+    if not persist:
+        return _prefix(N, seed)
+
+    return _load(N, seed)
+
+@functools.lru_cache(maxsize=32)
+def _load(N, seed):
+    path = os.path.join(tempfile.gettempdir(), "tls_v{}_{}_{}.npy".format(FORMAT_VERSION, seed, N))
+
+    if not os.path.exists(path):
+        partial = "{}.{}.partial".format(path, os.getpid())
+        with open(partial, "wb") as file:
+            numpy.save(file, numpy.stack(_prefix(N, seed)))
+        os.replace(partial, path)
+
+    # Copy-on-write rather than read-only, since typed memoryviews
+    # and the Numba signatures both reject read-only buffers
+    x, y = numpy.load(path, mmap_mode="c")
+    return x, y
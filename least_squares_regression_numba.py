@@ -0,0 +1,77 @@
+from numba import njit, prange
+
+# Explicit signatures compile eagerly at import, keeping compilation
+# out of the timed calls. They take C-contiguous (::1) arrays, as every
+# dataset is, since unknown strides stop the reductions vectorising
+
+@njit(["UniTuple(f8, 2)(f8[::1], f8[::1])"], cache=True, fastmath=True)
+def numba_lstsqr(x, y):
+    n = x.shape[0]
+    x_tot = y_tot = xx_tot = xy_tot = 0.0
+    for idx in range(n):
+        x_tot += x[idx]
+        y_tot += y[idx]
+        xx_tot += x[idx]*x[idx]
+        xy_tot += x[idx]*y[idx]
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
+    return (slope, y_interc)
+
+
+# Scalar += inside prange is turned into a per-thread reduction; the
+# thread count follows NUMBA_NUM_THREADS (all cores by default)
+
+@njit(["UniTuple(f8, 2)(f8[::1], f8[::1])"], cache=True, fastmath=True, parallel=True)
+def parallel_numba_lstsqr(x, y):
+    n = x.shape[0]
+    x_tot = y_tot = xx_tot = xy_tot = 0.0
+    for idx in prange(n):
+        x_tot += x[idx]
+        y_tot += y[idx]
+        xx_tot += x[idx]*x[idx]
+        xy_tot += x[idx]*y[idx]
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
+    return (slope, y_interc)
+
+
+# Four independent accumulators per sum break the add dependency
+# chains by hand; fastmath already lets LLVM do this for numba_lstsqr,
+# so this measures what manual unrolling adds on top
+
+@njit(["UniTuple(f8, 2)(f8[::1], f8[::1])"], cache=True, fastmath=True, boundscheck=False)
+def unrolled_numba_lstsqr(x, y):
+    n = x.shape[0]
+    x_tot0 = x_tot1 = x_tot2 = x_tot3 = 0.0
+    y_tot0 = y_tot1 = y_tot2 = y_tot3 = 0.0
+    xx_tot0 = xx_tot1 = xx_tot2 = xx_tot3 = 0.0
+    xy_tot0 = xy_tot1 = xy_tot2 = xy_tot3 = 0.0
+    for idx in range(0, n - n%4, 4):
+        x_tot0 += x[idx]
+        x_tot1 += x[idx+1]
+        x_tot2 += x[idx+2]
+        x_tot3 += x[idx+3]
+        y_tot0 += y[idx]
+        y_tot1 += y[idx+1]
+        y_tot2 += y[idx+2]
+        y_tot3 += y[idx+3]
+        xx_tot0 += x[idx]*x[idx]
+        xx_tot1 += x[idx+1]*x[idx+1]
+        xx_tot2 += x[idx+2]*x[idx+2]
+        xx_tot3 += x[idx+3]*x[idx+3]
+        xy_tot0 += x[idx]*y[idx]
+        xy_tot1 += x[idx+1]*y[idx+1]
+        xy_tot2 += x[idx+2]*y[idx+2]
+        xy_tot3 += x[idx+3]*y[idx+3]
+    for idx in range(n - n%4, n):
+        x_tot0 += x[idx]
+        y_tot0 += y[idx]
+        xx_tot0 += x[idx]*x[idx]
+        xy_tot0 += x[idx]*y[idx]
+    x_tot = x_tot0 + x_tot1 + x_tot2 + x_tot3
+    y_tot = y_tot0 + y_tot1 + y_tot2 + y_tot3
+    xx_tot = xx_tot0 + xx_tot1 + xx_tot2 + xx_tot3
+    xy_tot = xy_tot0 + xy_tot1 + xy_tot2 + xy_tot3
+    slope = (n*xy_tot - x_tot*y_tot) / (n*xx_tot - x_tot*x_tot)
+    y_interc = (y_tot - slope*x_tot) / n
+    return (slope, y_interc)
@@ -1,3 +1,7 @@
+import numpy
+
+from functools import lru_cache
+
 node      = "█"
 remainder = " ▏▎▍▌▋▊▉"
 overflowstr = "▓▓▒▒░░"
@@ -16,15 +20,8 @@ barparts = {
 	"bottomright": "┛",
 }
 
-def plot(names, data, width, *, formatter="{}".format, maximum=None):
-	namespace = max(map(len, names)) + 3
-
-	formatted_data = [formatter(datum) for datum in data]
-	dataspace = max(map(len, formatted_data))
-
-	barspace = width-4 - namespace - dataspace
-	overflow = overflowstr.rjust(barspace, node)
-
+@lru_cache(maxsize=None)
+def _frame(barspace, dataspace):
 	bartop = "{topleft}{top}{topright}{spacepadding}".format(
 		topleft  = barparts["topleft"],
 		top      = barparts["top"] * barspace,
@@ -39,24 +36,41 @@ def plot(names, data, width, *, formatter="{}".format, maximum=None):
 		spacepadding = " "*dataspace
 	)
 
-	print(" "*namespace, bartop)
+	return bartop, barbottom
 
-	for name, datum, datumstr in zip(names, data, formatted_data):
-		if maximum is not None:
-			datum = datum * barspace / maximum
-		else:
-			datum /= len(remainder)
+@lru_cache(maxsize=None)
+def _bar(full, partial):
+	return node * full + remainder[partial].rstrip()
 
-		# Odd order to catch NaN
-		if not datum <= barspace:
-			bar = overflow
-		else:
-			notches = round(datum * len(remainder))
+def plot(names, data, width, *, formatter="{}".format, maximum=None):
+	namespace = max(map(len, names)) + 3
+
+	formatted_data = [formatter(datum) for datum in data]
+	dataspace = max(map(len, formatted_data))
 
-			full, partial = divmod(notches, 8)
-			bar = node * full + remainder[partial].rstrip()
+	barspace = width-4 - namespace - dataspace
+	overflow = overflowstr.rjust(barspace, node)
+	bartop, barbottom = _frame(barspace, dataspace)
 
-		print("{name:>{namespace}} {left}{bar:{background}<{barspace}}{right} {datum:{dataspace}}".format(
+	scaled = numpy.asarray(data, dtype=numpy.float64)
+	if maximum is not None:
+		scaled = scaled * (barspace / maximum)
+	else:
+		scaled = scaled / len(remainder)
+
+	# Odd order to catch NaN
+	overflowed = ~(scaled <= barspace)
+	notches = numpy.rint(numpy.where(overflowed, 0, scaled) * len(remainder)).astype(int)
+	fulls, partials = numpy.divmod(notches, len(remainder))
+
+	rows = [" "*namespace + " " + bartop]
+
+	for name, datumstr, over, full, partial in zip(
+		names, formatted_data, overflowed.tolist(), fulls.tolist(), partials.tolist()
+	):
+		bar = overflow if over else _bar(full, partial)
+
+		rows.append("{name:>{namespace}} {left}{bar:{background}<{barspace}}{right} {datum:{dataspace}}".format(
 			name=name,
 			namespace=namespace,
 			left=barparts["left"],
@@ -68,4 +82,6 @@ def plot(names, data, width, *, formatter="{}".format, maximum=None):
 			dataspace=dataspace
 		))
 
-	print(" "*namespace, barbottom)
+	rows.append(" "*namespace + " " + barbottom)
+
+	return "\n".join(rows)
@@ -11,24 +11,25 @@ Options:
   -r --repeats=<rp>   Number of repeats. Minimum 4. [default: 16]
   -t --min-time=<mt>  Shortest time that a run must take [default: 1]
   --test-N=<N>         The size of input to use for the test section [default: 100000]
+  --persist           Keep datasets in the temporary directory between runs.
 """
 
 import docopt
+import gc
 import least_squares_regression
 import least_squares_regression_bytecode
-import numpy
+import least_squares_regression_datasets
+import least_squares_regression_numba
 import terminal_bars
 
-from decimal import Decimal
-from functools import partial
-from math import isnan, floor, log10
-from statistics import stdev, StatisticsError
-from timeit import Timer
+from math import inf, isfinite, isnan, sqrt
+from time import perf_counter_ns
 
 options = docopt.docopt(__doc__)
 N = int(options["--test-N"])
 REPEATS = int(options["--repeats"])
 MINTIME = float(options["--min-time"])
+PERSIST = options["--persist"]
 
 si_prefixes = [
     "y", "z", "a", "f", "p", "n", "µ", "m", "",
@@ -36,10 +37,16 @@ si_prefixes = [
 ]
 
 def engineering(number):
-    number = Decimal("{:.3e}".format(number))
-    exponents = floor(log10(number) / 3)
+    if number == 0 or not isfinite(number):
+        return "{:.3f}".format(number), ""
 
-    return number.scaleb(-3*exponents), si_prefixes[exponents+8]
+    # Shift the decimal point of the 4 significant figures
+    # to the nearest lower multiple of 3 in the exponent
+    mantissa, exponent = "{:.3e}".format(number).split("e")
+    sign, digits = mantissa[:-5], mantissa[-5] + mantissa[-3:]
+    exponents, point = divmod(int(exponent), 3)
+
+    return sign + digits[:point+1] + "." + digits[point+1:], si_prefixes[exponents+8]
 
 def format_constant_space(number, unit):
     if isnan(number):
@@ -48,23 +55,24 @@ def format_constant_space(number, unit):
     scaled, prefix = engineering(number)
     return "{} {:<2}".format(scaled, prefix+unit)
 
-def format_results(n, repeats, times, completed=1):
+def format_results(n, repeats, count, tmin, tsum, tsumsq, completed=1):
     template = (
         "{n:10} items, {repeats} loops:  "
         "{mintime} (± {error})  per item  "
         "({total} total) [{percent:4.0%}]"
     )
 
-    mintime = min(times) / (repeats*n)
+    mintime = tmin / (repeats*n)
 
-    try:
+    if count > 1:
         # True time is in theory below the lowest time,
         # so all deviation is above it
-        error = stdev(times, xbar=mintime) / (repeats*n)
-    except StatisticsError:
+        variance = (tsumsq - 2*tmin*tsum + count*tmin*tmin) / (count-1)
+        error = sqrt(max(variance, 0)) / (repeats*n)
+    else:
         error = float("nan")
 
-    total = sum(times)
+    total = tsum
 
     return template.format(
         n=n, repeats=repeats,
@@ -74,6 +82,19 @@ def format_results(n, repeats, times, completed=1):
         percent = completed
     )
 
+def bench(function, x, y, number, perf_counter_ns=perf_counter_ns):
+    # Like timeit, keep the collector from firing mid-measurement
+    gcold = gc.isenabled()
+    gc.disable()
+    try:
+        start = perf_counter_ns()
+        for _ in range(number):
+            function(x, y)
+        return (perf_counter_ns() - start) * 1e-9
+    finally:
+        if gcold:
+            gc.enable()
+
 def orders_n(start=100, factor=2):
     x = start
     while True:
@@ -85,25 +106,28 @@ functions = (
     least_squares_regression_bytecode.bytecode_auto_numpy_lstsqr,
     least_squares_regression_bytecode.bytecode_auto2_numpy_lstsqr,
     least_squares_regression_bytecode.bytecode_auto_scipy_lstsqr,
+    least_squares_regression_bytecode.bytecode_scipy_gelsy_lstsqr,
+    least_squares_regression_bytecode.bytecode_scipy_gelsd_lstsqr,
+    least_squares_regression_bytecode.bytecode_cholesky_lstsqr,
     least_squares_regression_bytecode.bytecode_untyped_lstsqr,
     least_squares_regression.matrix_lstsqr,
     least_squares_regression.auto_numpy_lstsqr,
     least_squares_regression.auto2_numpy_lstsqr,
     least_squares_regression.auto_scipy_lstsqr,
+    least_squares_regression.scipy_gelsy_lstsqr,
+    least_squares_regression.scipy_gelsd_lstsqr,
+    least_squares_regression.cholesky_lstsqr,
     least_squares_regression.untyped_lstsqr,
     least_squares_regression.simply_typed_lstsqr,
     least_squares_regression.memoryview_lstsqr,
     least_squares_regression.fully_typed_lstsqr,
     least_squares_regression.parallel_lstsqr,
+    least_squares_regression_numba.numba_lstsqr,
+    least_squares_regression_numba.parallel_numba_lstsqr,
+    least_squares_regression_numba.unrolled_numba_lstsqr,
 )
 
 function_times = {}
-datasets = {}
-
-numpy.random.seed(12345)
-x = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-y = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-datasets[N] = x, y
 
 print("TEST:")
 print()
@@ -111,7 +135,7 @@ print()
 namespace = max(len(function.__name__) for function in functions) + 1
 
 for function in functions:
-    slope, intercept = function(*datasets[N])
+    slope, intercept = function(*least_squares_regression_datasets.get_dataset(N, persist=PERSIST))
     print("{:<{}} y = {:.10f}·x + {:.10f}".format(function.__name__+":", namespace, slope, intercept))
 
 print()
@@ -123,26 +147,23 @@ for function in functions:
     print(function.__name__)
 
     for N in orders_n():
-        if N not in datasets:
-            numpy.random.seed(12345)
-            x = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-            y = numpy.random.choice([0.8, 0.9, 1.0, 1.1], size=N) * numpy.arange(N)
-            datasets[N] = x, y
-
         numtimes = int(REPEATS ** 0.5)
-        times = []
-        functimer = Timer(partial(function, *datasets[N]))
+        tmin, tsum, tsumsq = inf, 0.0, 0.0
+        x, y = least_squares_regression_datasets.get_dataset(N, persist=PERSIST)
 
         for i in range(numtimes):
             if i:
-                print(format_results(N, REPEATS, times, i/numtimes), end="\r")
+                print(format_results(N, REPEATS, i, tmin, tsum, tsumsq, i/numtimes), end="\r")
 
-            times.append(functimer.timeit(REPEATS))
+            taken = bench(function, x, y, REPEATS)
+            tmin = min(tmin, taken)
+            tsum += taken
+            tsumsq += taken*taken
 
-        function_times[function] = min(times) / (REPEATS*N)
-        print(format_results(N, REPEATS, times), end="\r")
+        function_times[function] = tmin / (REPEATS*N)
+        print(format_results(N, REPEATS, numtimes, tmin, tsum, tsumsq), end="\r")
 
-        if sum(times) > MINTIME:
+        if tsum > MINTIME:
             break
 
     print()
@@ -165,10 +186,10 @@ besttime = finaltimes[0][1]
 names = [function.__name__ for function, _ in finaltimes]
 times = [time / besttime   for _, time     in finaltimes]
 
-terminal_bars.plot(names, times, 100, formatter=simpleformatter)
+print(terminal_bars.plot(names, times, 100, formatter=simpleformatter))
 
 print()
 print("Zoomed:")
 print()
 
-terminal_bars.plot(names, times, 100, formatter=simpleformatter, maximum=times[0]*20)
+print(terminal_bars.plot(names, times, 100, formatter=simpleformatter, maximum=times[0]*20))